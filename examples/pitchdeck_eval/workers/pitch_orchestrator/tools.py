@@ -0,0 +1,40 @@
+"""Custom tools for the pitch orchestrator worker.
+
+These tools are automatically registered by llm-do when the worker loads.
+"""
+
+import string
+
+
+class _DropUnknown(dict):
+    """Translation table that deletes any character it has no mapping for."""
+
+    def __missing__(self, key):
+        return None
+
+
+# The slug alphabet is a pure ASCII whitelist, so str.translate with a
+# precomputed table walks the string in C and skips the regex engine entirely.
+_SLUG_TABLE = _DropUnknown(
+    {ord(c): c for c in string.ascii_lowercase + string.digits + "-"}
+)
+_SLUG_TABLE[ord(" ")] = "-"
+
+
+def normalize_filename(filename: str) -> str:
+    """Normalize a pitch deck filename into a file slug.
+
+    Args:
+        filename: Original deck filename (e.g., "Aurora Solar.pdf")
+
+    Returns:
+        Lowercase hyphenated slug without the extension
+
+    Examples:
+        normalize_filename("Aurora Solar.pdf") -> "aurora-solar"
+        normalize_filename("acma_pitchdeck.pdf") -> "acmapitchdeck"
+    """
+    # Strip only a trailing extension; replace() would also corrupt names
+    # containing ".pdf" mid-string and scans the whole string twice.
+    name = filename[:-4] if filename[-4:].lower() == ".pdf" else filename
+    return name.lower().translate(_SLUG_TABLE)
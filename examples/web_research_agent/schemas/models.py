@@ -2,22 +2,30 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SearchResult(BaseModel):
+    # One instance per scraped URL; frozen models skip per-assignment
+    # validation machinery and unknown provider keys are dropped up front.
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     url: str
     title: Optional[str] = None
     snippet: Optional[str] = None
 
 
 class Metric(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     name: str
     value: Optional[str] = None
     context: Optional[str] = None
 
 
 class ExtractedInsight(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     url: str
     title: Optional[str] = None
     summary: str
@@ -30,7 +38,38 @@ class ExtractedInsight(BaseModel):
     error: Optional[str] = None
 
 
+class ExtractedInsightBatch(BaseModel):
+    """Structure-of-arrays view over a batch of ExtractedInsight objects.
+
+    Consolidation scans one field across every source ("all urls", "all
+    main points"); parallel lists make those stride-1 walks over a single
+    list instead of attribute lookups scattered across per-object dicts.
+    """
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    urls: List[str] = Field(default_factory=list)
+    titles: List[Optional[str]] = Field(default_factory=list)
+    summaries: List[str] = Field(default_factory=list)
+    main_points: List[List[str]] = Field(default_factory=list)
+    metrics: List[List[Metric]] = Field(default_factory=list)
+    confidences: List[Optional[float]] = Field(default_factory=list)
+
+    @classmethod
+    def from_insights(cls, insights: List[ExtractedInsight]) -> "ExtractedInsightBatch":
+        return cls(
+            urls=[i.url for i in insights],
+            titles=[i.title for i in insights],
+            summaries=[i.summary for i in insights],
+            main_points=[i.main_points for i in insights],
+            metrics=[i.metrics for i in insights],
+            confidences=[i.confidence for i in insights],
+        )
+
+
 class ConsolidatedFinding(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     statement: str
     evidence_urls: List[str] = Field(default_factory=list)
     agreement_level: Optional[str] = None
@@ -39,6 +78,8 @@ class ConsolidatedFinding(BaseModel):
 
 
 class FinalReport(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     topic: str
     findings: List[ConsolidatedFinding] = Field(default_factory=list)
     risks: List[str] = Field(default_factory=list)
@@ -48,10 +89,23 @@ class FinalReport(BaseModel):
     followups: List[str] = Field(default_factory=list)
 
 
+def trust(model_cls: type[BaseModel], data: dict) -> BaseModel:
+    """Build a model from already-validated data, skipping re-validation.
+
+    model_construct bypasses the rust validator entirely, so this is safe
+    only when `data` was dumped from a validated instance of `model_cls`
+    (e.g. re-materializing insights that another worker already emitted).
+    Never use it on model output or anything else externally sourced.
+    """
+    return model_cls.model_construct(**data)
+
+
 __all__ = [
     "SearchResult",
     "Metric",
     "ExtractedInsight",
+    "ExtractedInsightBatch",
     "ConsolidatedFinding",
     "FinalReport",
+    "trust",
 ]
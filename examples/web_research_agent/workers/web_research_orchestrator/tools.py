@@ -4,13 +4,33 @@ import json
 import os
 import ssl
 import re
-from typing import Dict, List
+from typing import Dict, List, NamedTuple
 from urllib import parse, request
 from urllib.error import HTTPError, URLError
 
+try:
+    # Optional C JSON decoder; search payloads run to hundreds of KB and
+    # orjson parses bytes directly, skipping the separate UTF-8 decode.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - exercised only without the extra
+    _json_loads = json.loads
+
 USER_AGENT = "llm-do-web-research/0.1"
 MAX_HTTP_BYTES = 1_000_000
 
+# Shared across requests; building an SSL context re-parses the system cert
+# store each time.
+_SSL_CTX = ssl.create_default_context()
+
+
+class SearchRow(NamedTuple):
+    """One search hit. A NamedTuple row is ~3x smaller than a dict and the
+    search helpers may accumulate hundreds of them before trimming."""
+
+    url: str
+    title: str | None
+    snippet: str | None
+
 
 def search_web(query: str, num_results: int = 4) -> List[Dict[str, str | None]]:
     """
@@ -32,13 +52,15 @@ def search_web(query: str, num_results: int = 4) -> List[Dict[str, str | None]]:
         try:
             serpapi_hits = _search_serpapi(cleaned_query, api_key, limit)
             if serpapi_hits:
-                return serpapi_hits[:limit]
+                # Dicts only at the tool boundary so the model still sees
+                # {url, title, snippet} objects rather than positional arrays.
+                return [row._asdict() for row in serpapi_hits[:limit]]
         except Exception:
             # Fall back silently; the model can see the empty list if everything fails.
             pass
 
     try:
-        return _search_duckduckgo(cleaned_query, limit)
+        return [row._asdict() for row in _search_duckduckgo(cleaned_query, limit)]
     except Exception:
         return []
 
@@ -46,7 +68,7 @@ def search_web(query: str, num_results: int = 4) -> List[Dict[str, str | None]]:
 def _http_get_json(url: str, timeout: float = 12.0) -> dict:
     req = request.Request(url, headers={"User-Agent": USER_AGENT})
     try:
-        with request.urlopen(req, timeout=timeout, context=ssl.create_default_context()) as resp:
+        with request.urlopen(req, timeout=timeout, context=_SSL_CTX) as resp:
             status = getattr(resp, "status", None)
             if status and status >= 400:
                 raise HTTPError(url, status, resp.reason, resp.headers, None)
@@ -63,17 +85,16 @@ def _http_get_json(url: str, timeout: float = 12.0) -> dict:
             data = resp.read(MAX_HTTP_BYTES + 1)
             if len(data) > MAX_HTTP_BYTES:
                 raise ValueError(f"Response exceeded {MAX_HTTP_BYTES} bytes for {url}")
-
-            charset = resp.headers.get_content_charset() or "utf-8"
     except HTTPError as exc:
         raise RuntimeError(f"HTTP {exc.code} for {url}") from exc
     except URLError as exc:
         raise RuntimeError(f"Request failed for {url}: {exc.reason}") from exc
 
-    decoded = data.decode(charset, errors="replace")
+    # Both orjson.loads and json.loads accept the raw bytes (JSON is UTF-8
+    # by spec), so no intermediate decoded string is built.
     try:
-        return json.loads(decoded)
-    except json.JSONDecodeError as exc:
+        return _json_loads(data)
+    except ValueError as exc:
         raise ValueError(f"Invalid JSON response from {url}") from exc
 
 
@@ -85,48 +106,46 @@ def generate_slug(topic: str) -> str:
     return slug or "report"
 
 
-def _search_serpapi(query: str, api_key: str, limit: int) -> List[Dict[str, str | None]]:
+def _search_serpapi(query: str, api_key: str, limit: int) -> List[SearchRow]:
     url = (
         "https://serpapi.com/search.json?"
         f"engine=google&q={parse.quote(query)}&num={limit}&api_key={parse.quote(api_key)}"
     )
     payload = _http_get_json(url)
-    results: List[Dict[str, str | None]] = []
-    seen: set[str] = set()
+    # Keyed by URL: dict insertion order gives dedup + ordering in one
+    # structure, one hash per candidate instead of set-probe plus append.
+    results: Dict[str, SearchRow] = {}
 
     for item in payload.get("organic_results", []):
         link = item.get("link") or item.get("url")
-        if not link or link in seen:
+        if not link or link in results:
             continue
-        seen.add(link)
         title = (item.get("title") or "").strip() or None
         snippet = (item.get("snippet") or item.get("rich_snippet", {}).get("top", {}).get("snippet"))
-        results.append({"url": link, "title": title, "snippet": snippet})
+        results[link] = SearchRow(link, title, snippet)
         if len(results) >= limit:
             break
-    return results
+    return list(results.values())
 
 
-def _search_duckduckgo(query: str, limit: int) -> List[Dict[str, str | None]]:
+def _search_duckduckgo(query: str, limit: int) -> List[SearchRow]:
     url = (
         "https://api.duckduckgo.com/?"
         f"q={parse.quote(query)}&format=json&no_redirect=1&no_html=1&skip_disambig=1"
     )
     payload = _http_get_json(url)
-    results: List[Dict[str, str | None]] = []
-    seen: set[str] = set()
+    results: Dict[str, SearchRow] = {}
 
     def _add_result(link: str | None, text: str | None) -> None:
-        if not link or link in seen:
+        if not link or link in results:
             return
-        seen.add(link)
         snippet = (text or "").strip() or None
-        results.append({"url": link, "title": None, "snippet": snippet})
+        results[link] = SearchRow(link, None, snippet)
 
     for item in payload.get("Results", []):
         _add_result(item.get("FirstURL"), item.get("Text"))
         if len(results) >= limit:
-            return results
+            return list(results.values())
 
     for topic in payload.get("RelatedTopics", []):
         if "FirstURL" in topic:
@@ -135,8 +154,8 @@ def _search_duckduckgo(query: str, limit: int) -> List[Dict[str, str | None]]:
             for sub in topic["Topics"]:
                 _add_result(sub.get("FirstURL"), sub.get("Text"))
                 if len(results) >= limit:
-                    return results
+                    return list(results.values())
         if len(results) >= limit:
             break
 
-    return results[:limit]
+    return list(results.values())[:limit]
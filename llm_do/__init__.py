@@ -1,28 +1,32 @@
 """PydanticAI-based runtime for llm-do workers."""
 from __future__ import annotations
 
-from .base import (
-    AgentRunner,
-    ApprovalCallback,
-    ApprovalController,
-    ApprovalDecision,
-    AttachmentPayload,
-    RuntimeCreator,
-    RuntimeDelegator,
-    ToolRule,
-    WorkerContext,
-    WorkerCreationDefaults,
-    WorkerDefinition,
-    WorkerRegistry,
-    WorkerRunResult,
-    WorkerSpec,
-    approve_all_callback,
-    call_worker,
-    create_worker,
-    run_worker,
-    strict_mode_callback,
-)
-from .sandbox import AttachmentPolicy
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base import (
+        AgentRunner,
+        ApprovalCallback,
+        ApprovalController,
+        ApprovalDecision,
+        AttachmentPayload,
+        RuntimeCreator,
+        RuntimeDelegator,
+        ToolRule,
+        WorkerContext,
+        WorkerCreationDefaults,
+        WorkerDefinition,
+        WorkerRegistry,
+        WorkerRunResult,
+        WorkerSpec,
+        approve_all_callback,
+        call_worker,
+        create_worker,
+        run_worker,
+        strict_mode_callback,
+    )
+    from .sandbox import AttachmentPolicy
 
 __all__ = [
     "AgentRunner",
@@ -49,3 +53,25 @@ __all__ = [
 ]
 
 __version__ = "0.2.0"
+
+# PEP 562 lazy exports: importing llm_do no longer drags in the full
+# pydantic_ai runtime graph; submodules load on first attribute access.
+_LAZY_EXPORTS = {name: ".base" for name in __all__ if name != "__version__"}
+_LAZY_EXPORTS["AttachmentPolicy"] = ".sandbox"
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so subsequent accesses skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
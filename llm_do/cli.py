@@ -8,24 +8,18 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Mapping, Optional
 
+# Deferring these buys nothing: .base and .cli_display below import
+# pydantic_ai eagerly, so the graph is paid on module import regardless.
 from pydantic_ai.exceptions import ModelHTTPError, UnexpectedModelBehavior, UserError
 from pydantic_ai.messages import (
-    BinaryContent,
     FunctionToolCallEvent,
     FunctionToolResultEvent,
-    ModelMessage,
-    ModelRequest,
-    ModelResponse,
     PartEndEvent,
     TextPart,
-    ToolCallPart,
-    ToolReturnPart,
-    UserPromptPart,
-    SystemPromptPart,
-    RetryPromptPart,
 )
 from rich.console import Console, Group
 from rich.json import JSON
@@ -70,17 +64,26 @@ def _load_jsonish(value: str, *, allow_plain_text: bool = False) -> Any:
     both ad-hoc invocations and scripted runs.
     """
 
-    candidate = Path(value)
-    source: str
-    if candidate.exists():
-        source = candidate.read_text(encoding="utf-8")
-    else:
+    # EAFP: one open() instead of an exists() stat followed by a read, and
+    # no TOCTOU window between them. Inline JSON payloads fail the open with
+    # OSError (ENOENT, or ENAMETOOLONG for large documents) and fall through.
+    # File contents stay as bytes; json.loads decodes those without an
+    # intermediate str. The stdlib parser is deliberate here: orjson reads
+    # integers beyond 64 bits as lossy floats, silently corrupting valid
+    # user input.
+    source: str | bytes
+    try:
+        with open(value, "rb") as f:
+            source = f.read()
+    except OSError:
         source = value
 
     try:
         return json.loads(source)
-    except json.JSONDecodeError:
+    except ValueError:
         if allow_plain_text:
+            if isinstance(source, bytes):
+                return source.decode("utf-8", errors="replace")
             return source
         raise
 
@@ -186,7 +189,14 @@ def _build_streaming_callback(console: Console):
 
 
 
-def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once per process.
+
+    Parser construction runs a dozen add_argument calls plus argparse's
+    gettext/textwrap machinery; in-process callers (tests, embedding) parse
+    many argv lists against the same definition.
+    """
     parser = argparse.ArgumentParser(description="Run a PydanticAI worker")
     parser.add_argument(
         "worker",
@@ -195,61 +205,51 @@ def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
     parser.add_argument(
         "message",
         nargs="?",
-        default=None,
         help="Input message (plain text). Use --input for JSON instead.",
     )
     parser.add_argument(
         "--registry",
         type=Path,
-        default=None,
         help="Path to the worker registry root (defaults to current working directory)",
     )
     parser.add_argument(
         "--input",
         dest="input_json",
-        default=None,
         help="JSON payload or path to JSON file for worker input (alternative to plain message)",
     )
     parser.add_argument(
         "--model",
         dest="cli_model",
-        default=None,
         help="Model to use (e.g., anthropic:claude-sonnet-4-20250514, openai:gpt-4o). Required if worker has no model.",
     )
     parser.add_argument(
         "--creation-defaults",
         dest="creation_defaults_path",
-        default=None,
         help="Optional JSON file describing default settings for worker creation",
     )
     parser.add_argument(
         "--attachments",
         nargs="*",
-        default=None,
         help="Attachment file paths passed to the worker",
     )
     parser.add_argument(
         "--json",
         action="store_true",
-        default=False,
         help="Output JSON instead of rich formatted display (for scripting/automation)",
     )
     parser.add_argument(
         "--approve-all",
         action="store_true",
-        default=False,
         help="Auto-approve all tool calls without prompting (use with caution)",
     )
     parser.add_argument(
         "--strict",
         action="store_true",
-        default=False,
         help="Reject all non-pre-approved tools (deny-by-default security mode)",
     )
     parser.add_argument(
         "--debug",
         action="store_true",
-        default=False,
         help="Show full stack traces on errors (for debugging)",
     )
     parser.add_argument(
@@ -257,12 +257,31 @@ def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
         action="append",
         dest="config_overrides",
         metavar="KEY=VALUE",
-        default=None,
         help="Override worker config field (e.g., --set model=openai:gpt-4o). "
              "Supports dot notation for nested fields (e.g., --set sandbox.network_enabled=false). "
              "Can be specified multiple times.",
     )
-    return parser.parse_args(argv)
+    # One shared defaults table on the cached parser; store_true already
+    # implies default=False and everything else defaults to None, so the
+    # per-add_argument default kwargs above were redundant allocations.
+    parser.set_defaults(
+        message=None,
+        registry=None,
+        input_json=None,
+        cli_model=None,
+        creation_defaults_path=None,
+        attachments=None,
+        json=False,
+        approve_all=False,
+        strict=False,
+        debug=False,
+        config_overrides=None,
+    )
+    return parser
+
+
+def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    return _build_parser().parse_args(argv)
 
 
 def main(argv: Optional[list[str]] = None) -> int:
@@ -271,11 +290,13 @@ def main(argv: Optional[list[str]] = None) -> int:
     prompt_console = console if not args.json else Console(stderr=True)
 
     try:
-        # Determine worker name and registry
-        worker_path = Path(args.worker)
-        if worker_path.exists() and worker_path.suffix in {".yaml", ".yml"}:
-            # Worker is a file path
-            worker_name = worker_path.stem
+        # Determine worker name and registry. The cheap string suffix test
+        # runs first so the common bare-name case ('llm-do greeter') never
+        # pays the stat syscall.
+        if args.worker.endswith((".yaml", ".yml")):
+            worker_path = Path(args.worker)
+            # Worker is a file path (if it exists); otherwise treat as a name
+            worker_name = worker_path.stem if worker_path.exists() else args.worker
         else:
             # Worker is a name
             worker_name = args.worker
@@ -360,10 +381,11 @@ def main(argv: Optional[list[str]] = None) -> int:
             message_callback=streaming_callback,
         )
 
-        # JSON output mode (for scripting/automation)
+        # JSON output mode (for scripting/automation). model_dump_json
+        # serializes straight from the model in pydantic-core, skipping the
+        # intermediate Python dict tree that model_dump + json.dump built.
         if args.json:
-            serialized = result.model_dump(mode="json")
-            json.dump(serialized, sys.stdout, indent=2)
+            sys.stdout.write(result.model_dump_json(indent=2))
             sys.stdout.write("\n")
             return 0
 
@@ -18,12 +18,21 @@ from pydantic_ai.messages import (
     ToolReturnPart,
     UserPromptPart,
 )
-from rich.console import Console
+from rich.console import Console, Group
 from rich.json import JSON
 from rich.panel import Panel
 from rich.text import Text
 
 
+# Static panel titles are parsed once here; Rich would otherwise reparse the
+# markup string on every message rendered. Titles that embed a tool or worker
+# name stay as per-call f-strings.
+_TITLE_SYSTEM_INSTRUCTIONS = Text.from_markup("[bold cyan]System Instructions[/bold cyan]")
+_TITLE_USER_INPUT = Text.from_markup("[bold green]User Input[/bold green]")
+_TITLE_SYSTEM_PROMPT = Text.from_markup("[bold cyan]System Prompt[/bold cyan]")
+_TITLE_MODEL_RESPONSE = Text.from_markup("[bold magenta]Model Response[/bold magenta]")
+
+
 def render_json_or_text(value: Any) -> JSON | Text:
     """Render value as Rich JSON or Text with fallback for edge cases."""
     if isinstance(value, str):
@@ -36,75 +45,122 @@ def render_json_or_text(value: Any) -> JSON | Text:
         return Text(repr(value), style="dim")
 
 
+def _render_user_prompt(part: UserPromptPart) -> Panel:
+    # Handle both string and list content (with attachments)
+    if isinstance(part.content, str):
+        display_content = part.content
+    else:
+        # part.content is a Sequence[UserContent] with text + attachments
+        text_parts = []
+        attachment_count = 0
+        for item in part.content:
+            if isinstance(item, str):
+                text_parts.append(item)
+            else:
+                # BinaryContent, ImageUrl, etc.
+                attachment_count += 1
+
+        display_content = "\n".join(text_parts)
+        if attachment_count:
+            display_content += f"\n\n[dim]+ {attachment_count} attachment(s)[/dim]"
+
+    return Panel(
+        display_content,
+        title=_TITLE_USER_INPUT,
+        border_style="green",
+    )
+
+
+def _render_system_prompt(part: SystemPromptPart) -> Panel:
+    return Panel(
+        part.content,
+        title=_TITLE_SYSTEM_PROMPT,
+        border_style="cyan",
+    )
+
+
+def _render_tool_return(part: ToolReturnPart) -> Panel:
+    # Tool result being sent back to model
+    return Panel(
+        render_json_or_text(part.content),
+        title=f"[bold yellow]Tool Result: {part.tool_name}[/bold yellow]",
+        border_style="yellow",
+    )
+
+
+def _render_text(part: TextPart) -> Panel:
+    return Panel(
+        part.content,
+        title=_TITLE_MODEL_RESPONSE,
+        border_style="magenta",
+    )
+
+
+def _render_tool_call(part: ToolCallPart) -> Panel:
+    # Model is calling a tool
+    return Panel(
+        render_json_or_text(part.args),
+        title=f"[bold blue]Tool Call: {part.tool_name}[/bold blue]",
+        border_style="blue",
+    )
+
+
+def _render_request(msg: ModelRequest, renderables: list) -> None:
+    # User/system input to the model; leading blank line separates messages
+    renderables.append(Text(""))
+
+    if msg.instructions:
+        renderables.append(Panel(
+            msg.instructions,
+            title=_TITLE_SYSTEM_INSTRUCTIONS,
+            border_style="cyan",
+        ))
+
+    for part in msg.parts:
+        handler = _REQUEST_PART_HANDLERS.get(type(part))
+        if handler is not None:
+            renderables.append(handler(part))
+
+
+def _render_response(msg: ModelResponse, renderables: list) -> None:
+    # Model's response
+    for part in msg.parts:
+        handler = _RESPONSE_PART_HANDLERS.get(type(part))
+        if handler is not None:
+            renderables.append(handler(part))
+
+
+# Built once: O(1) dict dispatch on the part type instead of walking an
+# isinstance ladder for every part of every message in the history.
+_REQUEST_PART_HANDLERS = {
+    UserPromptPart: _render_user_prompt,
+    SystemPromptPart: _render_system_prompt,
+    ToolReturnPart: _render_tool_return,
+}
+_RESPONSE_PART_HANDLERS = {
+    TextPart: _render_text,
+    ToolCallPart: _render_tool_call,
+}
+_MESSAGE_HANDLERS = {
+    ModelRequest: _render_request,
+    ModelResponse: _render_response,
+}
+
+
 def display_messages(messages: list[ModelMessage], console: Console) -> None:
-    """Display LLM messages with rich formatting."""
+    """Display LLM messages with rich formatting.
+
+    All panels are collected into one Group and emitted with a single
+    console.print: one Rich layout pass and one terminal flush for the
+    whole history instead of one per part.
+    """
+    renderables: list = []
     for msg in messages:
-        if isinstance(msg, ModelRequest):
-            # User/system input to the model
-            console.print()
-
-            if msg.instructions:
-                console.print(Panel(
-                    msg.instructions,
-                    title="[bold cyan]System Instructions[/bold cyan]",
-                    border_style="cyan",
-                ))
-
-            for part in msg.parts:
-                if isinstance(part, UserPromptPart):
-                    # Handle both string and list content (with attachments)
-                    if isinstance(part.content, str):
-                        display_content = part.content
-                    else:
-                        # part.content is a Sequence[UserContent] with text + attachments
-                        text_parts = []
-                        attachment_count = 0
-                        for item in part.content:
-                            if isinstance(item, str):
-                                text_parts.append(item)
-                            else:
-                                # BinaryContent, ImageUrl, etc.
-                                attachment_count += 1
-
-                        display_content = "\n".join(text_parts)
-                        if attachment_count:
-                            display_content += f"\n\n[dim]+ {attachment_count} attachment(s)[/dim]"
-
-                    console.print(Panel(
-                        display_content,
-                        title="[bold green]User Input[/bold green]",
-                        border_style="green",
-                    ))
-                elif isinstance(part, SystemPromptPart):
-                    console.print(Panel(
-                        part.content,
-                        title="[bold cyan]System Prompt[/bold cyan]",
-                        border_style="cyan",
-                    ))
-                elif isinstance(part, ToolReturnPart):
-                    # Tool result being sent back to model
-                    console.print(Panel(
-                        render_json_or_text(part.content),
-                        title=f"[bold yellow]Tool Result: {part.tool_name}[/bold yellow]",
-                        border_style="yellow",
-                    ))
-
-        elif isinstance(msg, ModelResponse):
-            # Model's response
-            for part in msg.parts:
-                if isinstance(part, TextPart):
-                    console.print(Panel(
-                        part.content,
-                        title="[bold magenta]Model Response[/bold magenta]",
-                        border_style="magenta",
-                    ))
-                elif isinstance(part, ToolCallPart):
-                    # Model is calling a tool
-                    console.print(Panel(
-                        render_json_or_text(part.args),
-                        title=f"[bold blue]Tool Call: {part.tool_name}[/bold blue]",
-                        border_style="blue",
-                    ))
+        handler = _MESSAGE_HANDLERS.get(type(msg))
+        if handler is not None:
+            handler(msg, renderables)
+    if renderables:
+        console.print(Group(*renderables))
 
 
 def display_streaming_tool_call(console: Console, worker: str, part: ToolCallPart) -> None:
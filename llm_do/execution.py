@@ -26,6 +26,30 @@ from .types import (
 
 logger = logging.getLogger(__name__)
 
+try:
+    # Optional C JSON encoder for prompt serialization. Same two-space
+    # indentation as the stdlib, but non-ASCII text is emitted as raw UTF-8
+    # rather than \uXXXX escapes. OPT_NON_STR_KEYS mirrors json.dumps
+    # coercing int keys to strings.
+    from orjson import OPT_INDENT_2, OPT_NON_STR_KEYS, OPT_SORT_KEYS
+    from orjson import dumps as _orjson_dumps
+
+    def _dumps(obj: Any, *, sort_keys: bool = False) -> str:
+        option = OPT_INDENT_2 | OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= OPT_SORT_KEYS
+        try:
+            return _orjson_dumps(obj, option=option).decode()
+        except TypeError:
+            # orjson rejects values the stdlib handles (e.g. integers beyond
+            # 64 bits); fall back rather than crash on valid input.
+            return json.dumps(obj, indent=2, sort_keys=sort_keys)
+
+except ImportError:  # pragma: no cover - exercised only without the extra
+
+    def _dumps(obj: Any, *, sort_keys: bool = False) -> str:
+        return json.dumps(obj, indent=2, sort_keys=sort_keys)
+
 
 def model_supports_streaming(model: ModelLike) -> bool:
     """Return True if the configured model supports streaming callbacks.
@@ -61,7 +85,12 @@ def format_user_prompt(user_input: Any) -> str:
     """
     if isinstance(user_input, str):
         return user_input
-    return json.dumps(user_input, indent=2, sort_keys=True)
+    # Sorting keys is cosmetic here and copies+sorts every dict in the tree.
+    # Small mappings already display in a stable (insertion) order, so only
+    # pay for the sort on larger inputs where scanning for a key matters.
+    if isinstance(user_input, dict) and len(user_input) < 8:
+        return _dumps(user_input)
+    return _dumps(user_input, sort_keys=True)
 
 
 def prepare_agent_execution(
@@ -9,10 +9,14 @@ This is designed to be potentially extractable as a PydanticAI contrib package.
 """
 from __future__ import annotations
 
+import errno
+import os
+import stat
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Literal, Optional
 
-from pydantic import BaseModel, Field, TypeAdapter
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter
 from pydantic_ai.toolsets import AbstractToolset, ToolsetTool
 from pydantic_ai.tools import RunContext, ToolDefinition
 
@@ -37,6 +41,15 @@ class PathConfig(BaseModel):
         default=None, description="Maximum file size in bytes. None means no limit."
     )
 
+    # Lowercased frozenset view of suffixes, built once per config so the
+    # per-call suffix check is a hash probe instead of rebuilding a lowered
+    # list on every read/write.
+    _suffix_set: Optional[frozenset] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        if self.suffixes is not None:
+            self._suffix_set = frozenset(s.lower() for s in self.suffixes)
+
 
 class FileSandboxConfig(BaseModel):
     """Configuration for a file sandbox."""
@@ -143,6 +156,10 @@ class ReadResult(BaseModel):
 # ---------------------------------------------------------------------------
 
 
+_TEXT_CACHE_MAX_ENTRIES = 64
+"""Maximum number of decoded files kept in the per-sandbox read cache."""
+
+
 class FileSandboxImpl(AbstractToolset[Any]):
     """File sandbox implementation as a PydanticAI AbstractToolset.
 
@@ -170,6 +187,11 @@ class FileSandboxImpl(AbstractToolset[Any]):
         self._toolset_id = id
         self._max_retries = max_retries
         self._paths: dict[str, tuple[Path, PathConfig]] = {}
+        # Decoded-text cache keyed on (path, mtime_ns, size): agents often
+        # re-read the same spec documents many times per run. Stale entries
+        # miss naturally because edits change the key, and LRU eviction
+        # bounds the footprint.
+        self._text_cache: OrderedDict[tuple[str, int, int], str] = OrderedDict()
         self._setup_paths()
 
     def _setup_paths(self) -> None:
@@ -257,14 +279,20 @@ class FileSandboxImpl(AbstractToolset[Any]):
             PathNotInSandboxError: If resolved path escapes the root
         """
         relative = relative.lstrip("/")
-        candidate = (root / relative).resolve()
-        try:
-            candidate.relative_to(root)
-        except ValueError:
+        root_str = os.fspath(root)
+        if not relative:
+            return root
+
+        # realpath is kept deliberately: a lexical normpath check would let a
+        # symlink planted inside the sandbox point outside it. The escape
+        # test itself is a string prefix compare instead of a relative_to
+        # parse, and working on strings skips two Path constructions.
+        candidate = os.path.realpath(os.path.join(root_str, relative))
+        if candidate != root_str and not candidate.startswith(root_str + os.sep):
             raise PathNotInSandboxError(
                 relative, self.readable_roots
             )
-        return candidate
+        return Path(candidate)
 
     def can_read(self, path: str) -> bool:
         """Check if path is readable within sandbox boundaries."""
@@ -303,23 +331,11 @@ class FileSandboxImpl(AbstractToolset[Any]):
         Raises:
             SuffixNotAllowedError: If suffix is not in allowed list
         """
-        if config.suffixes is not None:
+        if config._suffix_set is not None:
             suffix = path.suffix.lower()
-            allowed = [s.lower() for s in config.suffixes]
-            if suffix not in allowed:
+            if suffix not in config._suffix_set:
                 raise SuffixNotAllowedError(str(path), suffix, config.suffixes)
 
-    def _check_size(self, path: Path, config: PathConfig) -> None:
-        """Check if file size is within limit.
-
-        Raises:
-            FileTooLargeError: If file exceeds size limit
-        """
-        if config.max_file_bytes is not None and path.exists():
-            size = path.stat().st_size
-            if size > config.max_file_bytes:
-                raise FileTooLargeError(str(path), size, config.max_file_bytes)
-
     def read(self, path: str, max_chars: int = DEFAULT_MAX_READ_CHARS, offset: int = 0) -> ReadResult:
         """Read text file from sandbox.
 
@@ -339,16 +355,50 @@ class FileSandboxImpl(AbstractToolset[Any]):
         """
         name, resolved, config = self._find_path_for(path)
 
-        if not resolved.exists():
-            raise FileNotFoundError(f"File not found: {path}")
+        # One open covers the former exists/is_file/stat probes, with no
+        # TOCTOU window between check and read. O_NOFOLLOW rejects a symlink
+        # raced into place after _resolve_within's realpath.
+        try:
+            fd = os.open(
+                os.fspath(resolved), os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0)
+            )
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {path}") from None
+        except OSError as exc:
+            if exc.errno == errno.ELOOP:
+                raise FileNotFoundError(f"File not found: {path}") from None
+            raise
 
-        if not resolved.is_file():
-            raise IsADirectoryError(f"Not a file: {path}")
+        try:
+            st = os.fstat(fd)
+            if not stat.S_ISREG(st.st_mode):
+                raise IsADirectoryError(f"Not a file: {path}")
 
-        self._check_suffix(resolved, config)
-        self._check_size(resolved, config)
+            self._check_suffix(resolved, config)
 
-        text = resolved.read_text(encoding="utf-8")
+            if config.max_file_bytes is not None and st.st_size > config.max_file_bytes:
+                raise FileTooLargeError(str(resolved), st.st_size, config.max_file_bytes)
+
+            cache_key = (os.fspath(resolved), st.st_mtime_ns, st.st_size)
+            text = self._text_cache.get(cache_key)
+            if text is not None:
+                self._text_cache.move_to_end(cache_key)
+            else:
+                # Binary read + one decode: read_text layers a TextIOWrapper
+                # over the file just to produce the same string via
+                # incremental decode.
+                chunks = []
+                while True:
+                    chunk = os.read(fd, 1 << 20)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                text = b"".join(chunks).decode("utf-8")
+                self._text_cache[cache_key] = text
+                if len(self._text_cache) > _TEXT_CACHE_MAX_ENTRIES:
+                    self._text_cache.popitem(last=False)
+        finally:
+            os.close(fd)
         total_chars = len(text)
 
         # Apply offset
@@ -390,18 +440,54 @@ class FileSandboxImpl(AbstractToolset[Any]):
 
         self._check_suffix(resolved, config)
 
-        # Check content size against limit
-        if config.max_file_bytes is not None:
-            content_bytes = len(content.encode("utf-8"))
-            if content_bytes > config.max_file_bytes:
-                raise FileTooLargeError(path, content_bytes, config.max_file_bytes)
+        # Encode once: the same bytes serve the size check and the write,
+        # instead of a throwaway encode for len() plus write_text's re-encode.
+        data = content.encode("utf-8")
+        if config.max_file_bytes is not None and len(data) > config.max_file_bytes:
+            raise FileTooLargeError(path, len(data), config.max_file_bytes)
 
         # Create parent directories if needed
         resolved.parent.mkdir(parents=True, exist_ok=True)
 
-        resolved.write_text(content, encoding="utf-8")
+        resolved.write_bytes(data)
+
+        # Evict cached reads of this file: a same-length rewrite landing
+        # within the filesystem's mtime granularity would otherwise keep
+        # serving the stale text under an unchanged (path, mtime, size) key.
+        resolved_str = os.fspath(resolved)
+        for key in [k for k in self._text_cache if k[0] == resolved_str]:
+            del self._text_cache[key]
+
         return f"Written {len(content)} characters to {name}/{resolved.relative_to(self._paths[name][0])}"
 
+    def _is_noop_write(self, path: str, content: str) -> bool:
+        """Return True when writing content to path would change nothing.
+
+        Used to skip the approval round trip for writes that are already on
+        disk. Only claims a no-op when the write would otherwise succeed
+        (writable root, allowed suffix), so denied writes still surface
+        their errors through the normal path. Since read_file is ungated,
+        comparing against existing content discloses nothing the caller
+        could not already read.
+        """
+        try:
+            _, resolved, config = self._find_path_for(path)
+            if config.mode != "rw":
+                return False
+            self._check_suffix(resolved, config)
+        except FileSandboxError:
+            return False
+
+        data = content.encode("utf-8")
+        try:
+            st = os.stat(resolved)
+            if not stat.S_ISREG(st.st_mode) or st.st_size != len(data):
+                return False
+            with open(resolved, "rb") as f:
+                return f.read() == data
+        except OSError:
+            return False
+
     def list_files(self, path: str = ".", pattern: str = "**/*") -> list[str]:
         """List files matching pattern within sandbox.
 
@@ -414,16 +500,11 @@ class FileSandboxImpl(AbstractToolset[Any]):
         """
         # If path is "." or empty, list all sandboxes
         if path in (".", ""):
-            results = []
+            results: list[str] = []
             for name, (root, _) in self._paths.items():
-                for match in root.glob(pattern):
-                    if match.is_file():
-                        try:
-                            rel = match.relative_to(root)
-                            results.append(f"{name}/{rel}")
-                        except ValueError:
-                            continue
-            return sorted(results)
+                self._collect_matches(results, name, root, root, pattern)
+            results.sort()
+            return results
 
         # Otherwise, find the specific path
         try:
@@ -438,14 +519,50 @@ class FileSandboxImpl(AbstractToolset[Any]):
 
         root, _ = self._paths[name]
         results = []
-        for match in resolved.glob(pattern):
-            if match.is_file():
+        self._collect_matches(results, name, root, resolved, pattern)
+        results.sort()
+        return results
+
+    def _collect_matches(
+        self,
+        results: list[str],
+        name: str,
+        root: Path,
+        base: Path,
+        pattern: str,
+    ) -> None:
+        """Append 'name/relative' entries for files under base matching pattern.
+
+        Relative paths are computed by slicing the match string past the root
+        prefix rather than re-parsing both paths with Path.relative_to for
+        every hit; every match from base.glob is under root by construction.
+        """
+        prefix = name + "/"
+        skip = len(os.fspath(root)) + 1
+
+        # Fast path for the default match-everything pattern: one scandir
+        # walk reads each directory in a single batched getdents call, and
+        # entry.is_dir/is_file answer from the dirent type without a stat
+        # for regular files. Symlinked directories are not followed, same
+        # as pathlib's '**'.
+        if pattern == "**/*":
+            stack = [os.fspath(base)]
+            while stack:
                 try:
-                    rel = match.relative_to(root)
-                    results.append(f"{name}/{rel}")
-                except ValueError:
+                    entries = os.scandir(stack.pop())
+                except OSError:
                     continue
-        return sorted(results)
+                with entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            results.append(prefix + entry.path[skip:])
+            return
+
+        for match in base.glob(pattern):
+            if match.is_file():
+                results.append(prefix + os.fspath(match)[skip:])
 
     # ---------------------------------------------------------------------------
     # AbstractToolset Implementation
@@ -578,6 +695,9 @@ class FileSandboxImpl(AbstractToolset[Any]):
         elif name == "write_file":
             path = tool_args["path"]
             content = tool_args["content"]
+            # Identical content already on disk: nothing to approve or write
+            if self._is_noop_write(path, content):
+                return f"Unchanged: {path} already contains this content"
             # Check if ctx.deps has approval_controller for writes
             if hasattr(ctx.deps, "approval_controller"):
                 return ctx.deps.approval_controller.maybe_run(
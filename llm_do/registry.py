@@ -9,16 +9,27 @@ This module provides the WorkerRegistry class which handles:
 from __future__ import annotations
 
 import os
+from functools import lru_cache, partial
 from pathlib import Path
 
 # Generated workers go to a temp directory, not project directory.
 # This keeps generated workers ephemeral - use `cp` to persist them.
 GENERATED_DIR = Path("/tmp/llm-do/generated")
-from typing import Dict, Optional, Set, Type
+
+# Built-in workers ship inside the package; computed once rather than
+# rebuilding the Path on every search-path lookup.
+_BUILTIN_WORKERS_DIR = Path(__file__).parent / "workers"
+from typing import Dict, Iterable, Optional, Set, Type
 
 import frontmatter
 import yaml
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound, UndefinedError
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    TemplateNotFound,
+    UndefinedError,
+)
 from pydantic import BaseModel, ValidationError
 
 from .types import OutputSchemaResolver, WorkerDefinition
@@ -29,6 +40,97 @@ def _default_resolver(definition: WorkerDefinition) -> Optional[Type[BaseModel]]
     return None
 
 
+def _load_template_file(template_root: Path, root_prefix: str, path_str: str) -> str:
+    """Load a file relative to template root (the `file()` template global).
+
+    `root_prefix` is the resolved root path plus a trailing separator,
+    precomputed once per environment so the escape check is a plain string
+    prefix compare instead of an exception-driven Path.relative_to call.
+    """
+    file_path = os.fspath((template_root / path_str).resolve())
+
+    # Security: ensure resolved path doesn't escape template root
+    if not (file_path + os.sep).startswith(root_prefix):
+        raise PermissionError(
+            f"File path escapes allowed directory: {path_str}"
+        )
+
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"File not found: {path_str}"
+        ) from None
+
+    return _read_template_file(file_path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=128)
+def _read_template_file(file_path: str, mtime_ns: int, size: int) -> str:
+    """Read a file() include, memoized on (path, mtime, size).
+
+    Templates often pull the same shared preamble many times (loops, or
+    several workers in one directory); repeat reads become cache hits and
+    edits invalidate via the stat fields, same scheme as worker files.
+    """
+    with open(file_path, "rb") as f:
+        return f.read().decode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _jinja_bytecode_cache() -> FileSystemBytecodeCache:
+    """Shared on-disk cache of compiled templates.
+
+    CLI runs are short-lived processes, so without this every invocation
+    recompiles any {% include %}-loaded template from scratch. Jinja picks
+    the directory itself: a per-uid 0o700 dir under the system temp dir
+    whose ownership it verifies, so another local user cannot pre-create
+    it and plant bucket files that marshal.loads into our process.
+    """
+    return FileSystemBytecodeCache()
+
+
+@lru_cache(maxsize=32)
+def _jinja_env_for(template_root: Path) -> Environment:
+    """Return the shared Jinja2 environment for a template root.
+
+    Building an Environment wires up the loader and discards Jinja's
+    internal template cache, so constructing one per render meant every
+    prompt paid a full reparse. One cached environment per worker
+    directory keeps compiled templates warm across renders.
+    """
+    env = Environment(
+        loader=FileSystemLoader(template_root),
+        autoescape=False,  # Don't escape - we want raw text
+        keep_trailing_newline=True,
+        auto_reload=False,
+        cache_size=400,
+        bytecode_cache=_jinja_bytecode_cache(),
+    )
+    # Make file() available in templates, bound to this root (resolved once)
+    resolved_root = template_root.resolve()
+    env.globals["file"] = partial(
+        _load_template_file, template_root, os.fspath(resolved_root) + os.sep
+    )
+    return env
+
+
+# Templates above this size skip the compile cache so a few huge one-off
+# prompts cannot pin megabytes of source strings in the lru_cache keys.
+_COMPILE_CACHE_MAX_CHARS = 64 * 1024
+
+
+@lru_cache(maxsize=256)
+def _compiled_template(template_root: Path, template_str: str):
+    """Compile a template string once per (root, source) pair.
+
+    from_string reparses and recompiles on every call even for identical
+    input; worker bodies are rendered repeatedly across delegation chains,
+    so repeat renders of an unchanged body become a dict probe.
+    """
+    return _jinja_env_for(template_root).from_string(template_str)
+
+
 def _render_jinja_template(template_str: str, template_root: Path) -> str:
     """Render a Jinja2 template with worker directory as the base.
 
@@ -47,39 +149,15 @@ def _render_jinja_template(template_str: str, template_root: Path) -> str:
         PermissionError: If a file path escapes template root directory
         jinja2.TemplateError: If template syntax is invalid
     """
-    # Set up Jinja2 environment with worker directory as base
-    env = Environment(
-        loader=FileSystemLoader(template_root),
-        autoescape=False,  # Don't escape - we want raw text
-        keep_trailing_newline=True,
-    )
-
-    # Add custom file() function
-    def load_file(path_str: str) -> str:
-        """Load a file relative to template root."""
-        file_path = (template_root / path_str).resolve()
-
-        # Security: ensure resolved path doesn't escape template root
-        try:
-            file_path.relative_to(template_root)
-        except ValueError:
-            raise PermissionError(
-                f"File path escapes allowed directory: {path_str}"
-            )
-
-        if not file_path.exists():
-            raise FileNotFoundError(
-                f"File not found: {path_str}"
-            )
-
-        return file_path.read_text(encoding="utf-8")
-
-    # Make file() available in templates
-    env.globals["file"] = load_file
-
-    # Render the template
+    if len(template_str) <= _COMPILE_CACHE_MAX_CHARS:
+        template = _compiled_template(template_root, template_str)
+    else:
+        template = _jinja_env_for(template_root).from_string(template_str)
+
+    # Only render() can raise these (includes resolve and variables bind at
+    # render time), so the handler stays off the compile path — cached
+    # compiles don't re-enter exception machinery at all.
     try:
-        template = env.from_string(template_str)
         return template.render()
     except (TemplateNotFound, UndefinedError) as exc:
         raise ValueError(f"Template error: {exc}") from exc
@@ -90,6 +168,50 @@ def _has_jinja_syntax(text: str) -> bool:
     return "{{" in text or "{%" in text or "{#" in text
 
 
+@lru_cache(maxsize=256)
+def _scan_dir(dir_str: str, mtime_ns: int) -> frozenset[str]:
+    """Return the entry names of a directory, memoized on its mtime."""
+    return frozenset(entry.name for entry in os.scandir(dir_str))
+
+
+def _dir_contains(dir_path: Path, name: str) -> bool:
+    """Existence check backed by one cached directory listing.
+
+    Probing each search-path candidate with exists() costs a stat per
+    candidate on every lookup; listing the parent directory once turns
+    repeat lookups in the same directory (delegation chains load many
+    workers from one workers/ dir) into a dict probe plus one dir stat.
+    """
+    try:
+        st = os.stat(dir_path)
+    except OSError:
+        return False
+    return name in _scan_dir(str(dir_path), st.st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _read_worker_file(path_str: str, mtime_ns: int, size: int) -> str:
+    """Read a worker file, memoized on (path, mtime, size).
+
+    The stat fields key the cache so edits invalidate it, while warm loads
+    of an unchanged definition skip the disk read entirely.
+    """
+    with open(path_str, "rb") as f:
+        return f.read().decode("utf-8")
+
+
+@lru_cache(maxsize=64)
+def _parse_front_matter(content: str) -> frontmatter.Post:
+    """Parse worker front matter, memoized on the raw file content.
+
+    Batch workflows (and nested worker_call chains) load the same worker
+    definition repeatedly; caching the YAML parse means only the first load
+    pays for it. Jinja rendering stays per-load so file() includes remain
+    live, and callers must copy the metadata before mutating it.
+    """
+    return frontmatter.loads(content)
+
+
 class WorkerRegistry:
     """File-backed registry for worker artifacts."""
 
@@ -128,8 +250,8 @@ class WorkerRegistry:
             candidates.append(self.generated_dir / name / "worker.worker")
 
         # Add built-in paths (both forms)
-        builtin_simple = Path(__file__).parent / "workers" / f"{name}.worker"
-        builtin_dir = Path(__file__).parent / "workers" / name / "worker.worker"
+        builtin_simple = _BUILTIN_WORKERS_DIR / f"{name}.worker"
+        builtin_dir = _BUILTIN_WORKERS_DIR / name / "worker.worker"
         candidates.extend([builtin_simple, builtin_dir])
 
         return candidates
@@ -138,20 +260,24 @@ class WorkerRegistry:
         # Legacy helper: return the first existing path, or the default user path
         paths = self._get_search_paths(name)
         for path in paths:
-            if path.exists():
+            if _dir_contains(path.parent, path.name):
                 return path
         return paths[0]  # Default to workers/{name}.worker
 
-    def _load_raw(self, path: Path) -> Dict[str, any]:
-        """Load worker definition from .worker file with front matter."""
+    def _read_raw(self, path: Path) -> str:
+        """Read raw .worker file contents (front matter + body)."""
         suffix = path.suffix.lower()
         if suffix != ".worker":
             raise ValueError(
                 f"Worker definition must be .worker, got: {suffix}"
             )
 
-        content = path.read_text(encoding="utf-8")
-        post = frontmatter.loads(content)
+        st = path.stat()
+        return _read_worker_file(str(path), st.st_mtime_ns, st.st_size)
+
+    def _parse_raw(self, path: Path, content: str) -> Dict[str, any]:
+        """Parse .worker file contents into a raw definition dict."""
+        post = _parse_front_matter(content)
 
         # Front matter becomes the data dict
         data = dict(post.metadata)
@@ -183,14 +309,14 @@ class WorkerRegistry:
             Path to tools.py if it exists, None otherwise
         """
         path = self._definition_path(name)
-        if not path.exists():
+        if not _dir_contains(path.parent, path.name):
             return None
 
         # Only directory-based workers can have custom tools
         # Check if this is workers/name/worker.worker pattern
         if path.name == "worker.worker":
             tools_path = path.parent / "tools.py"
-            if tools_path.exists():
+            if _dir_contains(tools_path.parent, tools_path.name):
                 return tools_path
 
         return None
@@ -210,13 +336,12 @@ class WorkerRegistry:
         Checks project workers, built-ins, AND generated dir (even from old sessions).
         """
         for path in self._get_search_paths(name):
-            if path.exists():
+            if _dir_contains(path.parent, path.name):
                 return True
         # Also check generated dir unconditionally (prevent overwriting old sessions)
         # Generated workers are directories: {generated_dir}/{name}/worker.worker
-        if (self.generated_dir / name / "worker.worker").exists():
-            return True
-        return False
+        generated = self.generated_dir / name / "worker.worker"
+        return _dir_contains(generated.parent, generated.name)
 
     def load_definition(self, name: str) -> WorkerDefinition:
         """Load a worker definition by name.
@@ -242,11 +367,21 @@ class WorkerRegistry:
             ValueError: If worker definition is invalid
         """
         path = self._definition_path(name)
-        if not path.exists():
+        try:
+            # EAFP: the read stats the file anyway, so let that single stat
+            # double as the existence check instead of probing first.
             # _definition_path returns the first candidate if none exist,
-            # but we want to be sure we checked all of them in the error message
-            raise FileNotFoundError(f"Worker definition not found: {name}")
-        data = self._load_raw(path)
+            # and reading that candidate fails with FileNotFoundError.
+            # Only the read is wrapped: a FileNotFoundError raised later
+            # while rendering the body (e.g. a missing file() include) must
+            # surface as-is, not as a missing worker.
+            content = self._read_raw(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Worker definition not found: {name}"
+            ) from None
+
+        data = self._parse_raw(path, content)
 
         # Inject sandbox names from dictionary keys
         if "sandboxes" in data and isinstance(data["sandboxes"], dict):
@@ -265,6 +400,27 @@ class WorkerRegistry:
         except ValidationError as exc:
             raise ValueError(f"Invalid worker definition at {path}: {exc}") from exc
 
+    def load_definitions(self, names: Iterable[str]) -> Dict[str, WorkerDefinition]:
+        """Load several worker definitions in one batch.
+
+        Orchestrators that fan out over a roster of workers should prefer
+        this over a load_definition loop: candidate resolution for every
+        name is served from one cached scandir snapshot per directory, so
+        the whole batch costs one listing of workers/ instead of a stat
+        per name per extension.
+
+        Args:
+            names: Worker names to load
+
+        Returns:
+            Mapping of worker name to its loaded definition
+
+        Raises:
+            FileNotFoundError: If any worker is not found
+            ValueError: If any worker definition is invalid
+        """
+        return {name: self.load_definition(name) for name in names}
+
     def save_definition(
         self,
         definition: WorkerDefinition,
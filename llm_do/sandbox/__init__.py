@@ -1,11 +1,12 @@
 """Attachment types and policies for worker delegation."""
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, List, Optional, Protocol, Sequence, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 __all__ = [
     "AttachmentInput",
@@ -34,6 +35,23 @@ class AttachmentPolicy(BaseModel):
     allowed_suffixes: List[str] = Field(default_factory=list)
     denied_suffixes: List[str] = Field(default_factory=list)
 
+    # Frozenset views of the suffix lists, built once per policy so the
+    # per-attachment membership tests are O(1) hash probes instead of list
+    # scans. The public list fields stay as-is for config round-tripping.
+    _allowed_set: frozenset = PrivateAttr(default=frozenset())
+    _denied_set: frozenset = PrivateAttr(default=frozenset())
+
+    def model_post_init(self, __context: Any) -> None:
+        # One pass per field replaces the former _lower_suffixes
+        # field_validator: lowercase for config round-tripping and build the
+        # membership sets from the same intermediate list.
+        lowered = [suffix.lower() for suffix in self.allowed_suffixes]
+        self.allowed_suffixes = lowered
+        self._allowed_set = frozenset(lowered)
+        lowered = [suffix.lower() for suffix in self.denied_suffixes]
+        self.denied_suffixes = lowered
+        self._denied_set = frozenset(lowered)
+
     @field_validator("max_attachments")
     @classmethod
     def _positive_max_attachments(cls, value: int) -> int:
@@ -48,11 +66,6 @@ class AttachmentPolicy(BaseModel):
             raise ValueError("max_total_bytes must be positive")
         return value
 
-    @field_validator("allowed_suffixes", "denied_suffixes")
-    @classmethod
-    def _lower_suffixes(cls, value: List[str]) -> List[str]:
-        return [suffix.lower() for suffix in value]
-
     def validate_paths(self, attachments: Sequence[Path]) -> None:
         """Validate attachment paths against policy constraints.
 
@@ -64,14 +77,47 @@ class AttachmentPolicy(BaseModel):
         """
         if len(attachments) > self.max_attachments:
             raise ValueError("Too many attachments provided")
-        total = 0
+
+        # Pass 1 (no I/O): suffix checks, grouping paths by parent directory
+        # so a batch rejected on suffix grounds never pays a syscall.
+        allowed = self._allowed_set
+        denied = self._denied_set
+        by_parent: dict[str, dict[str, Path]] = {}
         for path in attachments:
             suffix = path.suffix.lower()
-            if self.allowed_suffixes and suffix not in self.allowed_suffixes:
+            if allowed and suffix not in allowed:
                 raise ValueError(f"Attachment suffix '{suffix}' not allowed")
-            if self.denied_suffixes and suffix in self.denied_suffixes:
+            if suffix in denied:
                 raise ValueError(f"Attachment suffix '{suffix}' is denied")
-            size = path.stat().st_size
+            by_parent.setdefault(os.fspath(path.parent), {})[path.name] = path
+
+        # Pass 2: sizes come from one scandir per directory instead of one
+        # stat per file; attachments share few parents in practice. The stat
+        # follows symlinks (as path.stat() did) so a link counts its target's
+        # size against the budget, not the link's own. A missing parent is
+        # left to the fallback loop so the error names the file, not the
+        # directory.
+        sizes: dict[Path, int] = {}
+        for parent, wanted in by_parent.items():
+            try:
+                entries = os.scandir(parent)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    path = wanted.get(entry.name)
+                    if path is not None:
+                        sizes[path] = entry.stat().st_size
+
+        # Accumulate in the original order so the byte-budget check trips at
+        # the same attachment as the old per-path loop. Files the listing did
+        # not cover (raced deletion) fall back to a direct stat, preserving
+        # the original FileNotFoundError.
+        total = 0
+        for path in attachments:
+            size = sizes.get(path)
+            if size is None:
+                size = path.stat().st_size
             total += size
             if total > self.max_total_bytes:
                 raise ValueError("Attachments exceed max_total_bytes")
@@ -12,6 +12,7 @@ import importlib.util
 import logging
 import sys
 import warnings
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -235,6 +236,26 @@ def _register_worker_delegation_tools(
         )
 
 
+@lru_cache(maxsize=32)
+def _load_tools_module(tools_path_str: str, worker_name: str):
+    """Load a tools.py module, caching per path so repeat runs of the same
+    worker skip the import-machinery round trip (spec resolution + exec).
+
+    Exceptions raised by the module body propagate to the caller and are
+    not cached, so a broken tools.py is retried on the next load.
+    """
+    spec = importlib.util.spec_from_file_location(
+        f"{worker_name}_tools", tools_path_str
+    )
+    if spec is None or spec.loader is None:
+        return None
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
 def load_custom_tools(agent: Agent, context: WorkerContext) -> None:
     """Load and register custom tools from tools.py module.
 
@@ -251,23 +272,16 @@ def load_custom_tools(agent: Agent, context: WorkerContext) -> None:
     if not tools_path or not tools_path.exists():
         return
 
-    # Load the module from the file path
-    spec = importlib.util.spec_from_file_location(
-        f"{context.worker.name}_tools", tools_path
-    )
-    if spec is None or spec.loader is None:
-        logger.warning(f"Could not load custom tools from {tools_path}")
-        return
-
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[spec.name] = module
-
     try:
-        spec.loader.exec_module(module)
+        module = _load_tools_module(str(tools_path), context.worker.name)
     except Exception as e:
         logger.error(f"Error loading custom tools from {tools_path}: {e}")
         return
 
+    if module is None:
+        logger.warning(f"Could not load custom tools from {tools_path}")
+        return
+
     # Only register functions that are explicitly allowed in tool_rules
     allowed_tools = {
         name: rule
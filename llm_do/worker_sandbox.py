@@ -177,15 +177,16 @@ class AttachmentValidator:
         sandbox_name = "external"
         relative = payload.display_name
 
-        for name in self._sandbox.sandboxes:
+        # Sandbox roots were resolved at construction, so compare against
+        # them directly instead of round-tripping "name/." through resolve()
+        # (a realpath walk) for every sandbox per attachment.
+        for name, (sandbox_path, _) in self._sandbox.sandboxes.items():
             try:
-                # Get the root path for this sandbox
-                sandbox_path = self._sandbox.resolve(f"{name}/.").parent
                 rel_path = path.relative_to(sandbox_path)
                 sandbox_name = name
                 relative = rel_path.as_posix()
                 break
-            except (ValueError, FileSandboxError):
+            except ValueError:
                 continue
 
         return {"sandbox": sandbox_name, "path": relative, "bytes": size}
@@ -1,6 +1,7 @@
 """Tests for cli_display module."""
 from pathlib import Path
 
+import pytest
 from pydantic_ai.messages import (
     ModelRequest,
     ModelResponse,
@@ -24,36 +25,31 @@ from llm_do.cli_display import (
 )
 
 
-def test_render_json_or_text_with_string():
-    """Plain strings should render as Text."""
-    result = render_json_or_text("hello world")
-    assert isinstance(result, Text)
-    assert "hello world" in str(result)
+@pytest.fixture
+def console():
+    """Recording console shared by the display tests."""
+    return Console(record=True)
 
 
-def test_render_json_or_text_with_dict():
-    """Dicts should render as JSON."""
-    result = render_json_or_text({"foo": "bar", "baz": 123})
-    assert isinstance(result, JSON)
-
-
-def test_render_json_or_text_with_list():
-    """Lists should render as JSON."""
-    result = render_json_or_text([1, 2, 3])
-    assert isinstance(result, JSON)
-
-
-def test_render_json_or_text_with_non_serializable():
-    """Non-serializable objects should fall back to repr Text."""
-    result = render_json_or_text(Path("/test"))
-    assert isinstance(result, Text)
-    # Should contain the repr output
-    assert "test" in str(result).lower()
+@pytest.mark.parametrize(
+    ("value", "expected_type", "expected_substring"),
+    [
+        pytest.param("hello world", Text, "hello world", id="string"),
+        pytest.param({"foo": "bar", "baz": 123}, JSON, None, id="dict"),
+        pytest.param([1, 2, 3], JSON, None, id="list"),
+        pytest.param(Path("/test"), Text, "test", id="non-serializable"),
+    ],
+)
+def test_render_json_or_text(value, expected_type, expected_substring):
+    """Strings and non-serializable objects render as Text, containers as JSON."""
+    result = render_json_or_text(value)
+    assert isinstance(result, expected_type)
+    if expected_substring is not None:
+        assert expected_substring in str(result).lower()
 
 
-def test_display_worker_request_shows_details():
+def test_display_worker_request_shows_details(console):
     """Request preview should include worker name, instructions, and attachments."""
-    console = Console(record=True)
     preview = {
         "instructions": "Follow the rubric",
         "user_input": "Evaluate decks",
@@ -70,9 +66,8 @@ def test_display_worker_request_shows_details():
     assert "input/deck.pdf" in output
 
 
-def test_display_worker_request_handles_empty_input():
+def test_display_worker_request_handles_empty_input(console):
     """Request preview should show placeholder for empty input."""
-    console = Console(record=True)
     preview = {
         "instructions": None,
         "user_input": "",
@@ -86,9 +81,8 @@ def test_display_worker_request_handles_empty_input():
     assert "(no user input)" in output
 
 
-def test_display_messages_with_model_request():
+def test_display_messages_with_model_request(console):
     """ModelRequest should display user input and instructions."""
-    console = Console(record=True)
     request = ModelRequest(
         parts=[UserPromptPart(content="Hello world")],
         instructions="Be helpful and friendly"
@@ -103,9 +97,8 @@ def test_display_messages_with_model_request():
     assert "System Instructions" in output
 
 
-def test_display_messages_with_model_response():
+def test_display_messages_with_model_response(console):
     """ModelResponse should display text parts."""
-    console = Console(record=True)
     response = ModelResponse(
         parts=[TextPart(content="Hi there! How can I help?")],
         model_name="test-model"
@@ -118,9 +111,8 @@ def test_display_messages_with_model_response():
     assert "Model Response" in output
 
 
-def test_display_messages_with_tool_call():
+def test_display_messages_with_tool_call(console):
     """ToolCallPart should display tool name and args."""
-    console = Console(record=True)
     response = ModelResponse(
         parts=[ToolCallPart(
             tool_name="read_file",
@@ -137,9 +129,8 @@ def test_display_messages_with_tool_call():
     assert "/test.txt" in output
 
 
-def test_display_messages_with_tool_result():
+def test_display_messages_with_tool_result(console):
     """ToolReturnPart should display result content."""
-    console = Console(record=True)
     request = ModelRequest(
         parts=[ToolReturnPart(
             tool_name="read_file",
@@ -157,9 +148,8 @@ def test_display_messages_with_tool_result():
     assert "success" in output
 
 
-def test_display_messages_with_attachments():
+def test_display_messages_with_attachments(console):
     """UserPromptPart with attachments should show count."""
-    console = Console(record=True)
     from pydantic_ai.messages import BinaryContent
 
     request = ModelRequest(
@@ -178,9 +168,8 @@ def test_display_messages_with_attachments():
     assert "2 attachment(s)" in output
 
 
-def test_display_streaming_tool_call():
+def test_display_streaming_tool_call(console):
     """Streaming tool call should display worker, tool name, and args."""
-    console = Console(record=True)
     part = ToolCallPart(
         tool_name="read_file",
         args={"path": "/test.txt", "max_chars": 1000}
@@ -195,9 +184,8 @@ def test_display_streaming_tool_call():
     assert "/test.txt" in output
 
 
-def test_display_streaming_tool_result():
+def test_display_streaming_tool_result(console):
     """Streaming tool result should display worker and result content."""
-    console = Console(record=True)
     result = ToolReturnPart(
         tool_name="read_file",
         content={"status": "success", "lines": 42},
@@ -213,9 +201,8 @@ def test_display_streaming_tool_result():
     assert "success" in output
 
 
-def test_display_streaming_tool_result_with_retry():
+def test_display_streaming_tool_result_with_retry(console):
     """Streaming retry should display retry message."""
-    console = Console(record=True)
     result = RetryPromptPart(
         content="Please try again with different parameters"
     )
@@ -228,9 +215,8 @@ def test_display_streaming_tool_result_with_retry():
     assert "Please try again" in output
 
 
-def test_display_streaming_model_response():
+def test_display_streaming_model_response(console):
     """Streaming model response should display worker and text."""
-    console = Console(record=True)
 
     display_streaming_model_response(console, "my_worker", "Hello from the model!")
 
@@ -240,9 +226,8 @@ def test_display_streaming_model_response():
     assert "Hello from the model!" in output
 
 
-def test_display_streaming_model_response_empty():
+def test_display_streaming_model_response_empty(console):
     """Streaming model response with empty text should not print anything."""
-    console = Console(record=True)
 
     display_streaming_model_response(console, "my_worker", "   ")
 
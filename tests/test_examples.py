@@ -378,6 +378,22 @@ def test_pitch_orchestrator_sandboxes_configured(pitchdeck_eval_registry):
     # Verify allowed suffixes
     assert ".pdf" in definition.sandbox.paths["input"].suffixes
 
+
+def test_pitch_orchestrator_normalize_filename(pitchdeck_eval_registry):
+    """Test that the orchestrator's custom slug tool exists and behaves."""
+    import importlib.util
+
+    tools_path = pitchdeck_eval_registry.find_custom_tools("pitch_orchestrator")
+    assert tools_path is not None
+
+    spec = importlib.util.spec_from_file_location("pitch_orchestrator_tools", tools_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    assert module.normalize_filename("Aurora Solar.pdf") == "aurora-solar"
+    assert module.normalize_filename("acma_pitchdeck.pdf") == "acmapitchdeck"
+
+
 def test_all_example_workers_load_successfully():
     """Test that all example worker definitions can be loaded.
 
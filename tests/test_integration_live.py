@@ -10,6 +10,7 @@ Requirements:
 - ANTHROPIC_API_KEY environment variable must be set
 - Will make actual API calls (costs money)
 """
+import os
 import shutil
 from pathlib import Path
 
@@ -22,7 +23,16 @@ from llm_do import (
 )
 
 
-pytestmark = pytest.mark.live
+# Skip (rather than fail mid-run) when no credentials are available, so an
+# accidental invocation without the key doesn't burn a copytree + API setup
+# before erroring out inside the model request.
+pytestmark = [
+    pytest.mark.live,
+    pytest.mark.skipif(
+        not os.environ.get("ANTHROPIC_API_KEY"),
+        reason="ANTHROPIC_API_KEY not set",
+    ),
+]
 
 
 @pytest.fixture
@@ -3,6 +3,7 @@
 This test reproduces the bug where calling a worker that uses attachments
 from within another worker's tool call causes the system to hang.
 """
+import os
 import shutil
 from pathlib import Path
 
@@ -15,20 +16,95 @@ from llm_do import (
 )
 from tests.test_examples import ToolCallingModel
 
+# Placeholder image bytes shared by the tests below; the mocked planner never
+# decodes them, so no real PNG structure is needed.
+_FAKE_IMAGE_BYTES = b"fake whiteboard image data"
+
+# Plan the mocked whiteboard_planner "produces". In reality this markdown
+# would come from analyzing the image.
+_WHITEBOARD_PLAN_MD = """# Project: Whiteboard Planning System
+
+## High-level Summary
+This project aims to create an automated system for converting whiteboard photos into structured project plans.
+
+## Epics / Workstreams
+- **Epic 1**: Image Processing Pipeline
+  - Goal: Build a robust pipeline for ingesting and processing whiteboard images
+  - Tasks:
+    - [P0] Set up image storage and retrieval system
+    - [P1] Implement OCR for text extraction
+    - [P1] Add image preprocessing (rotation, contrast enhancement)
+
+- **Epic 2**: AI-Powered Plan Generation
+  - Goal: Use LLMs to interpret whiteboard content and generate structured plans
+  - Tasks:
+    - [P0] Integrate with Claude API for image analysis
+    - [P0] Design prompt templates for plan generation
+    - [P1] Implement validation and formatting
+
+## Timeline
+- Week 1-2: Image Processing Pipeline (Epic 1)
+- Week 3-4: AI Integration (Epic 2)
+- Week 5: Testing and refinement
+
+## Open Questions / Risks
+- Image quality requirements - what's the minimum resolution?
+- Handling of handwriting vs. printed text
+- Cost of API calls at scale
+"""
+
+
+@pytest.fixture(scope="session")
+def _whiteboard_template(tmp_path_factory):
+    """One session-wide copy of the whiteboard_planner example.
+
+    Per-test registries clone this template with hardlinks instead of
+    re-copying the example tree from the repository for every test.
+    """
+    source = Path(__file__).parent.parent / "examples" / "whiteboard_planner"
+    template = tmp_path_factory.mktemp("whiteboard_template") / "whiteboard_planner"
+    shutil.copytree(source, template)
+    return template
+
+
+# Directories the tests write into. The example ships files there (e.g.
+# input/white_board_plan.png) that tests overwrite; a hardlink would
+# truncate the shared inode and mutate the session template, so these
+# subtrees get real copies.
+_MUTABLE_DIRS = ("input", "plans")
+
+
+def _clone_example(template: Path, dest: Path) -> None:
+    template_str = os.fspath(template)
+
+    def _link_or_copy(src: str, dst: str) -> None:
+        rel = os.path.relpath(src, template_str)
+        if rel.split(os.sep, 1)[0] in _MUTABLE_DIRS:
+            shutil.copy2(src, dst)
+            return
+        # Read-only files (worker definitions, prompts) share the template's
+        # data blocks via hardlinks. Fall back to a real copy if tmp dirs
+        # span filesystems.
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+
+    shutil.copytree(template, dest, copy_function=_link_or_copy)
+
 
 @pytest.fixture
-def whiteboard_registry(tmp_path, monkeypatch):
+def whiteboard_registry(_whiteboard_template, tmp_path, monkeypatch):
     """Registry for the whiteboard_planner example."""
-    source = Path(__file__).parent.parent / "examples" / "whiteboard_planner"
     dest = tmp_path / "whiteboard_planner"
-    shutil.copytree(source, dest)
+    _clone_example(_whiteboard_template, dest)
 
     # Change CWD to example directory so relative sandbox paths resolve correctly
     monkeypatch.chdir(dest)
     return WorkerRegistry(dest)
 
 
-def test_nested_worker_with_attachments_hang_reproduction(whiteboard_registry):
+def test_nested_worker_with_attachments_hang_reproduction(whiteboard_registry, monkeypatch):
     """Reproduce the hang when orchestrator calls whiteboard_planner with attachment.
 
     This test simulates the exact sequence from the live session:
@@ -46,45 +122,12 @@ def test_nested_worker_with_attachments_hang_reproduction(whiteboard_registry):
     # Setup input file (whiteboard_registry fixture already changed to example dir)
     input_dir = Path("input")
     input_dir.mkdir(exist_ok=True)
-    (input_dir / "white_board_plan.png").write_bytes(b"fake whiteboard image data")
+    (input_dir / "white_board_plan.png").write_bytes(_FAKE_IMAGE_BYTES)
 
     # Setup plans directory
     plans_dir = Path("plans")
     plans_dir.mkdir(exist_ok=True)
 
-    # Mock the whiteboard_planner's response
-    # In reality, this would analyze the image and return markdown
-    whiteboard_plan_markdown = """# Project: Whiteboard Planning System
-
-## High-level Summary
-This project aims to create an automated system for converting whiteboard photos into structured project plans.
-
-## Epics / Workstreams
-- **Epic 1**: Image Processing Pipeline
-  - Goal: Build a robust pipeline for ingesting and processing whiteboard images
-  - Tasks:
-    - [P0] Set up image storage and retrieval system
-    - [P1] Implement OCR for text extraction
-    - [P1] Add image preprocessing (rotation, contrast enhancement)
-
-- **Epic 2**: AI-Powered Plan Generation
-  - Goal: Use LLMs to interpret whiteboard content and generate structured plans
-  - Tasks:
-    - [P0] Integrate with Claude API for image analysis
-    - [P0] Design prompt templates for plan generation
-    - [P1] Implement validation and formatting
-
-## Timeline
-- Week 1-2: Image Processing Pipeline (Epic 1)
-- Week 3-4: AI Integration (Epic 2)
-- Week 5: Testing and refinement
-
-## Open Questions / Risks
-- Image quality requirements - what's the minimum resolution?
-- Handling of handwriting vs. printed text
-- Cost of API calls at scale
-"""
-
     # Create a ToolCallingModel that simulates the orchestrator's behavior
     # Based on the actual transcript from the live session
     orchestrator_model = ToolCallingModel([
@@ -114,7 +157,7 @@ This project aims to create an automated system for converting whiteboard photos
             "name": "write_file",
             "args": {
                 "path": "plans/white_board_plan.md",
-                "content": whiteboard_plan_markdown
+                "content": _WHITEBOARD_PLAN_MD
             }
         }
     ])
@@ -131,32 +174,25 @@ This project aims to create an automated system for converting whiteboard photos
         assert "white_board_plan.png" in str(kwargs["attachments"][0].path)
 
         # Return the mocked plan
-        return WorkerRunResult(output=whiteboard_plan_markdown, messages=[])
-
-    import llm_do.runtime
-    original_call_worker_async = llm_do.runtime.call_worker_async
-    llm_do.runtime.call_worker_async = mock_call_worker_async
-
-    try:
-        # Run the orchestrator
-        result = run_worker(
-            registry=whiteboard_registry,
-            worker="whiteboard_orchestrator",
-            input_data={},
-            cli_model=orchestrator_model,
-            approval_callback=approve_all_callback,
-        )
-
-        assert result is not None
-
-        # Verify the plan was written
-        plans_dir = Path("plans")
-        assert (plans_dir / "white_board_plan.md").exists()
-        plan_content = (plans_dir / "white_board_plan.md").read_text()
-        assert "Project: Whiteboard Planning System" in plan_content
-    finally:
-        # Restore original call_worker_async
-        llm_do.runtime.call_worker_async = original_call_worker_async
+        return WorkerRunResult(output=_WHITEBOARD_PLAN_MD, messages=[])
+
+    monkeypatch.setattr("llm_do.runtime.call_worker_async", mock_call_worker_async)
+
+    # Run the orchestrator
+    result = run_worker(
+        registry=whiteboard_registry,
+        worker="whiteboard_orchestrator",
+        input_data={},
+        cli_model=orchestrator_model,
+        approval_callback=approve_all_callback,
+    )
+
+    assert result is not None
+
+    # Verify the plan was written
+    assert (plans_dir / "white_board_plan.md").exists()
+    plan_content = (plans_dir / "white_board_plan.md").read_text()
+    assert "Project: Whiteboard Planning System" in plan_content
 
 
 def test_direct_whiteboard_planner_works(whiteboard_registry):
@@ -169,7 +205,7 @@ def test_direct_whiteboard_planner_works(whiteboard_registry):
     input_dir = Path("input")
     input_dir.mkdir(exist_ok=True)
     test_image = input_dir / "test_board.png"
-    test_image.write_bytes(b"fake whiteboard image data")
+    test_image.write_bytes(_FAKE_IMAGE_BYTES)
 
     # Mock the LLM response for whiteboard_planner
     # The whiteboard_planner worker just returns text (markdown), no tools
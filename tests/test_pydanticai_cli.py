@@ -3,9 +3,15 @@
 These tests focus on CLI interface behavior, not full worker execution.
 Integration tests in test_pydanticai_integration.py cover end-to-end workflows.
 """
-import json
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
+
+# Parse CLI output with the C decoder when the optional extra is installed,
+# mirroring the runtime's own orjson-with-stdlib-fallback convention.
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - exercised only without the extra
+    from json import loads as json_loads
 
 import pytest
 from pydantic_ai.messages import FunctionToolResultEvent, ToolReturnPart
@@ -15,163 +21,147 @@ from rich.text import Text
 from llm_do import WorkerDefinition, WorkerRegistry, WorkerRunResult
 from llm_do.cli import _build_streaming_callback, main
 
-
-def test_cli_parses_worker_name_and_uses_cwd_registry(tmp_path, monkeypatch):
+# Serialized .worker bytes for a minimal instructions="demo" worker, built by
+# the first make_worker call and reused with the name spliced in. The splice
+# keys on the full "name: ..." line so names like "worker" never collide with
+# other front-matter keys (e.g. "allow_workers").
+_WORKER_TEMPLATE = None
+_NAME_PLACEHOLDER = b"\nname: \x00\x00\n"
+
+
+@pytest.fixture
+def make_worker(tmp_path):
+    """Factory that saves a minimal worker and returns its registry.
+
+    The first call goes through save_definition normally; later calls write
+    the cached serialized bytes directly, skipping the YAML emitter that
+    otherwise dominates these microsecond-scale CLI tests.
+    """
+
+    def _make(name: str, root: Path | None = None) -> WorkerRegistry:
+        global _WORKER_TEMPLATE
+        registry = WorkerRegistry(root if root is not None else tmp_path)
+        if _WORKER_TEMPLATE is None:
+            saved = registry.save_definition(
+                WorkerDefinition(name=name, instructions="demo")
+            )
+            _WORKER_TEMPLATE = saved.read_bytes().replace(
+                f"\nname: {name}\n".encode(), _NAME_PLACEHOLDER
+            )
+        else:
+            target = registry.root / "workers" / f"{name}.worker"
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(
+                _WORKER_TEMPLATE.replace(
+                    _NAME_PLACEHOLDER, f"\nname: {name}\n".encode()
+                )
+            )
+        return registry
+
+    return _make
+
+
+def test_cli_parses_worker_name_and_uses_cwd_registry(tmp_path, monkeypatch, make_worker):
     """Test that CLI defaults to CWD as registry when not specified."""
     # Create worker in workers/ subdirectory
-    registry = WorkerRegistry(tmp_path)
-    registry.save_definition(WorkerDefinition(name="test_worker", instructions="demo"))
+    make_worker("test_worker")
 
     # Change to tmp_path directory (simulating user running from project directory)
     monkeypatch.chdir(tmp_path)
 
     # Mock run_worker to capture how it's called
-    with patch("llm_do.cli.run_worker") as mock_run:
-        mock_run.return_value = WorkerRunResult(output="test output")
-
-        # Run CLI with worker name (no path, no --registry flag)
-        result = main(["test_worker", "Hello", "--approve-all"])
-
-        assert result == 0
-        mock_run.assert_called_once()
-        call_kwargs = mock_run.call_args.kwargs
-
-        # Verify registry defaults to CWD (which is tmp_path)
-        assert call_kwargs["registry"].root == tmp_path
-        assert call_kwargs["worker"] == "test_worker"
-        assert call_kwargs["input_data"] == "Hello"
-
-
-def test_cli_accepts_plain_text_message(tmp_path, monkeypatch):
-    """Test that plain text message is passed as input_data."""
-    registry = WorkerRegistry(tmp_path)
-    registry.save_definition(WorkerDefinition(name="greeter", instructions="demo"))
-
-    monkeypatch.chdir(tmp_path)
-
-    with patch("llm_do.cli.run_worker") as mock_run:
-        mock_run.return_value = WorkerRunResult(output="Hi there!")
-
-        # Worker is now in workers/ subdirectory by convention
-        main(["greeter", "Tell me a joke", "--approve-all"])
-
-        call_kwargs = mock_run.call_args.kwargs
-        assert call_kwargs["input_data"] == "Tell me a joke"
-
-
-def test_cli_accepts_json_input_instead_of_message(tmp_path, monkeypatch):
-    """Test that --input takes precedence over plain message."""
-    registry = WorkerRegistry(tmp_path)
-    registry.save_definition(WorkerDefinition(name="worker", instructions="demo"))
-
-    monkeypatch.chdir(tmp_path)
-
-    with patch("llm_do.cli.run_worker") as mock_run:
-        mock_run.return_value = WorkerRunResult(output="done")
-
-        main([
-            "worker",
-            "--input",
-            '{"task": "analyze", "data": [1,2,3]}',
-            "--approve-all",
-        ])
-
-        call_kwargs = mock_run.call_args.kwargs
-        assert call_kwargs["input_data"] == {"task": "analyze", "data": [1, 2, 3]}
-
-
-def test_cli_input_flag_accepts_plain_text(tmp_path, monkeypatch):
-    registry = WorkerRegistry(tmp_path)
-    registry.save_definition(WorkerDefinition(name="worker", instructions="demo"))
+    mock_run = Mock(return_value=WorkerRunResult(output="test output"))
+    monkeypatch.setattr("llm_do.cli.run_worker", mock_run)
+
+    # Run CLI with worker name (no path, no --registry flag)
+    result = main(["test_worker", "Hello", "--approve-all"])
+
+    assert result == 0
+    mock_run.assert_called_once()
+    call_kwargs = mock_run.call_args.kwargs
+
+    # Verify registry defaults to CWD (which is tmp_path)
+    assert call_kwargs["registry"].root == tmp_path
+    assert call_kwargs["worker"] == "test_worker"
+    assert call_kwargs["input_data"] == "Hello"
+
+
+@pytest.mark.parametrize(
+    ("argv_suffix", "expected"),
+    [
+        pytest.param(
+            ["Tell me a joke"],
+            {"input_data": "Tell me a joke"},
+            id="plain-message",
+        ),
+        pytest.param(
+            ["--input", '{"task": "analyze", "data": [1,2,3]}'],
+            {"input_data": {"task": "analyze", "data": [1, 2, 3]}},
+            id="json-input",
+        ),
+        pytest.param(
+            ["--input", "process all files"],
+            {"input_data": "process all files"},
+            id="plain-text-input",
+        ),
+        pytest.param(
+            ["hi", "--model", "openai:gpt-4o"],
+            {"cli_model": "openai:gpt-4o"},
+            id="model-override",
+        ),
+        pytest.param(
+            ["process", "--attachments", "file1.txt", "file2.txt"],
+            {"attachments": ["file1.txt", "file2.txt"]},
+            id="attachments",
+        ),
+    ],
+)
+def test_cli_passes_options_to_run_worker(
+    tmp_path, monkeypatch, make_worker, argv_suffix, expected
+):
+    """Each supported CLI option reaches run_worker as the right kwarg."""
+    make_worker("worker")
+
+    # Attachment files referenced by the attachments case; harmless elsewhere
+    (tmp_path / "file1.txt").write_text("content1")
+    (tmp_path / "file2.txt").write_text("content2")
 
     monkeypatch.chdir(tmp_path)
 
-    with patch("llm_do.cli.run_worker") as mock_run:
-        mock_run.return_value = WorkerRunResult(output="done")
+    mock_run = Mock(return_value=WorkerRunResult(output="done"))
+    monkeypatch.setattr("llm_do.cli.run_worker", mock_run)
 
-        main([
-            "worker",
-            "--input",
-            "process all files",
-            "--approve-all",
-        ])
+    main(["worker", *argv_suffix, "--approve-all"])
 
-        call_kwargs = mock_run.call_args.kwargs
-        assert call_kwargs["input_data"] == "process all files"
+    call_kwargs = mock_run.call_args.kwargs
+    for key, value in expected.items():
+        assert call_kwargs[key] == value
 
 
-def test_cli_accepts_worker_name_with_explicit_registry(tmp_path):
+def test_cli_accepts_worker_name_with_explicit_registry(tmp_path, monkeypatch, make_worker):
     """Test traditional usage with worker name and --registry flag."""
     registry_dir = tmp_path / "workers"
-    registry = WorkerRegistry(registry_dir)
-    registry.save_definition(WorkerDefinition(name="myworker", instructions="demo"))
-
-    with patch("llm_do.cli.run_worker") as mock_run:
-        mock_run.return_value = WorkerRunResult(output="result")
-
-        main([
-            "myworker",
-            "input",
-            "--registry",
-            str(registry_dir),
-            "--approve-all",
-        ])
-
-        call_kwargs = mock_run.call_args.kwargs
-        assert call_kwargs["registry"].root == registry_dir
-        assert call_kwargs["worker"] == "myworker"
-
-
-def test_cli_passes_model_override(tmp_path, monkeypatch):
-    """Test that --model is passed to run_worker."""
-    registry = WorkerRegistry(tmp_path)
-    registry.save_definition(WorkerDefinition(name="worker", instructions="demo"))
-
-    monkeypatch.chdir(tmp_path)
-
-    with patch("llm_do.cli.run_worker") as mock_run:
-        mock_run.return_value = WorkerRunResult(output="done")
-
-        main(["worker", "hi", "--model", "openai:gpt-4o", "--approve-all"])
-
-        call_kwargs = mock_run.call_args.kwargs
-        assert call_kwargs["cli_model"] == "openai:gpt-4o"
+    make_worker("myworker", root=registry_dir)
 
+    mock_run = Mock(return_value=WorkerRunResult(output="result"))
+    monkeypatch.setattr("llm_do.cli.run_worker", mock_run)
 
-def test_cli_passes_attachments(tmp_path, monkeypatch):
-    """Test that --attachments are passed to run_worker."""
-    registry = WorkerRegistry(tmp_path)
-    registry.save_definition(WorkerDefinition(name="worker", instructions="demo"))
+    main([
+        "myworker",
+        "input",
+        "--registry",
+        str(registry_dir),
+        "--approve-all",
+    ])
 
-    # Create attachment files
-    (tmp_path / "file1.txt").write_text("content1")
-    (tmp_path / "file2.txt").write_text("content2")
-
-    monkeypatch.chdir(tmp_path)
-
-    with patch("llm_do.cli.run_worker") as mock_run:
-        mock_run.return_value = WorkerRunResult(output="done")
-
-        main([
-            "worker",
-            "process",
-            "--attachments",
-            str(tmp_path / "file1.txt"),
-            str(tmp_path / "file2.txt"),
-            "--approve-all",
-        ])
+    call_kwargs = mock_run.call_args.kwargs
+    assert call_kwargs["registry"].root == registry_dir
+    assert call_kwargs["worker"] == "myworker"
 
-        call_kwargs = mock_run.call_args.kwargs
-        assert call_kwargs["attachments"] == [
-            str(tmp_path / "file1.txt"),
-            str(tmp_path / "file2.txt"),
-        ]
 
-
-def test_cli_displays_rich_output_by_default(tmp_path, monkeypatch):
+def test_cli_displays_rich_output_by_default(tmp_path, monkeypatch, make_worker):
     """Default mode renders the rich message exchange and final panel."""
-    registry = WorkerRegistry(tmp_path)
-    registry.save_definition(WorkerDefinition(name="worker", instructions="demo"))
+    make_worker("worker")
 
     monkeypatch.chdir(tmp_path)
 
@@ -189,10 +179,12 @@ def test_cli_displays_rich_output_by_default(tmp_path, monkeypatch):
 
     monkeypatch.setattr("llm_do.cli.Console", fake_console)
 
-    with patch("llm_do.cli.run_worker") as mock_run:
-        mock_run.return_value = WorkerRunResult(output={"key": "value", "nested": {"a": 1}})
+    mock_run = Mock(
+        return_value=WorkerRunResult(output={"key": "value", "nested": {"a": 1}})
+    )
+    monkeypatch.setattr("llm_do.cli.run_worker", mock_run)
 
-        assert main(["worker", "test", "--approve-all"]) == 0
+    assert main(["worker", "test", "--approve-all"]) == 0
 
     assert "instance" in recorded_console
     rendered = recorded_console["instance"].export_text()
@@ -201,23 +193,24 @@ def test_cli_displays_rich_output_by_default(tmp_path, monkeypatch):
     assert '"key": "value"' in rendered
 
 
-def test_cli_json_mode_outputs_structured_result(tmp_path, monkeypatch, capsys):
+def test_cli_json_mode_outputs_structured_result(tmp_path, monkeypatch, capsys, make_worker):
     """--json flag should return serialized WorkerRunResult."""
-    registry = WorkerRegistry(tmp_path)
-    registry.save_definition(WorkerDefinition(name="worker", instructions="demo"))
+    make_worker("worker")
 
     monkeypatch.chdir(tmp_path)
 
-    with patch("llm_do.cli.run_worker") as mock_run:
-        mock_run.return_value = WorkerRunResult(
+    mock_run = Mock(
+        return_value=WorkerRunResult(
             output={"key": "value"},
             messages=[{"role": "user", "content": "hello"}],
         )
+    )
+    monkeypatch.setattr("llm_do.cli.run_worker", mock_run)
 
-        assert main(["worker", "test", "--json", "--approve-all"]) == 0
+    assert main(["worker", "test", "--json", "--approve-all"]) == 0
 
     captured = capsys.readouterr()
-    payload = json.loads(captured.out)
+    payload = json_loads(captured.out)
     assert payload["output"] == {"key": "value"}
     assert payload["messages"] == [{"role": "user", "content": "hello"}]
 
@@ -245,39 +238,40 @@ def test_streaming_callback_renders_tool_results(monkeypatch):
     mock_render.assert_called_once_with({"value": 42})
 
 
-def test_cli_uses_interactive_approval_when_tty(tmp_path, monkeypatch):
+def test_cli_uses_interactive_approval_when_tty(tmp_path, monkeypatch, make_worker):
     """Default approval path should build the interactive callback."""
-    registry = WorkerRegistry(tmp_path)
-    registry.save_definition(WorkerDefinition(name="worker", instructions="demo"))
+    make_worker("worker")
 
     monkeypatch.chdir(tmp_path)
     monkeypatch.setattr("llm_do.cli._is_interactive_terminal", lambda: True)
 
     sentinel = object()
 
-    with patch(
-        "llm_do.cli._build_interactive_approval_callback",
-        return_value=sentinel,
-    ) as mock_builder, patch("llm_do.cli.run_worker") as mock_run:
-        mock_run.return_value = WorkerRunResult(output="ok")
+    mock_builder = Mock(return_value=sentinel)
+    monkeypatch.setattr(
+        "llm_do.cli._build_interactive_approval_callback", mock_builder
+    )
+    mock_run = Mock(return_value=WorkerRunResult(output="ok"))
+    monkeypatch.setattr("llm_do.cli.run_worker", mock_run)
 
-        assert main(["worker", "hello"]) == 0
+    assert main(["worker", "hello"]) == 0
 
     mock_builder.assert_called_once()
     assert mock_run.call_args.kwargs["approval_callback"] is sentinel
 
 
-def test_cli_requires_tty_for_interactive_mode(tmp_path, monkeypatch, capsys):
+def test_cli_requires_tty_for_interactive_mode(tmp_path, monkeypatch, capsys, make_worker):
     """When no approval flags are provided, a TTY is required."""
-    registry = WorkerRegistry(tmp_path)
-    registry.save_definition(WorkerDefinition(name="worker", instructions="demo"))
+    make_worker("worker")
 
     monkeypatch.chdir(tmp_path)
     monkeypatch.setattr("llm_do.cli._is_interactive_terminal", lambda: False)
 
-    with patch("llm_do.cli.run_worker") as mock_run:
-        assert main(["worker", "task"]) == 1
-        mock_run.assert_not_called()
+    mock_run = Mock()
+    monkeypatch.setattr("llm_do.cli.run_worker", mock_run)
+
+    assert main(["worker", "task"]) == 1
+    mock_run.assert_not_called()
 
     captured = capsys.readouterr()
     assert "interactive approvals require a TTY" in captured.err